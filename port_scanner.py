@@ -1,33 +1,129 @@
+import errno
+import os
+import selectors
 import socket
+import time
+from collections import deque
 from datetime import datetime
-import concurrent.futures
 
-def scan_port(ip, port):
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Windows reports a pending non-blocking connect as WSAEWOULDBLOCK rather than EINPROGRESS.
+# On POSIX, EWOULDBLOCK (EAGAIN) from connect() is a failure, so it must not count as pending.
+WSAEWOULDBLOCK = getattr(errno, "WSAEWOULDBLOCK", None)
+# connect() results that mean this host ran out of something (local ports, buffers, memory),
+# not that the target refused; a port that hits one of these has not been probed at all.
+LOCAL_CONNECT_ERRORS = frozenset(
+    getattr(errno, name)
+    for name in (
+        "EAGAIN", "EADDRINUSE", "EADDRNOTAVAIL", "ENOBUFS", "ENOMEM",
+        "WSAEADDRINUSE", "WSAEADDRNOTAVAIL", "WSAENOBUFS",
+    )
+    if hasattr(errno, name)
+)
+# select() on Windows cannot watch more than 512 sockets at once.
+SELECT_MAX_IN_FLIGHT = 500
+# Descriptors left free for stdio, the selector itself and anything else the process holds.
+FD_HEADROOM = 32
+
+def start_connect(ip, port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
+        sock.setblocking(False)
         result = sock.connect_ex((ip, port))
-        if result == 0:
-            return port
-        else:
-            return None
-    except socket.error:
-        return None
+    except OSError:
+        sock.close()
+        raise
+    if result in (0, errno.EINPROGRESS, WSAEWOULDBLOCK):
+        return sock, result
+    sock.close()
+    if result in LOCAL_CONNECT_ERRORS:
+        raise OSError(result, os.strerror(result))
+    return None, result
+
+def is_open(sock):
+    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+        return False
+    try:
+        # On loopback, a probe whose ephemeral port equals the target port connects to itself.
+        return sock.getsockname() != sock.getpeername()
+    except OSError:
+        return False
+
+def run_scan(ip, max_in_flight=1024, timeout=1, ports=range(1, 65536)):
+    selector = selectors.DefaultSelector()
+    if isinstance(selector, selectors.SelectSelector):
+        max_in_flight = min(max_in_flight, SELECT_MAX_IN_FLIGHT)
+    if resource is not None:
+        soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft_limit != resource.RLIM_INFINITY:
+            max_in_flight = min(max_in_flight, max(soft_limit - FD_HEADROOM, 1))
+    pending = deque(ports)
+    deadlines = deque()
+    open_ports = []
+
+    def report(port):
+        open_ports.append(port)
+        print(f"Port {port} is OPEN")
+
+    def reap(sock):
+        selector.unregister(sock)
+        sock.close()
+
+    try:
+        while pending or selector.get_map():
+            while pending and len(selector.get_map()) < max_in_flight:
+                port = pending.popleft()
+                try:
+                    sock, result = start_connect(ip, port)
+                except OSError:
+                    # A local failure (EMFILE, ENOBUFS, no free local port, ...) says nothing
+                    # about the target: wait for in-flight sockets to release resources and
+                    # retry, and never count the port as closed.
+                    if not selector.get_map():
+                        raise
+                    pending.appendleft(port)
+                    break
+                if sock is None:
+                    continue
+                if result == 0:
+                    if is_open(sock):
+                        report(port)
+                    sock.close()
+                    continue
+                selector.register(sock, selectors.EVENT_WRITE, port)
+                deadlines.append((time.monotonic() + timeout, sock))
+
+            if not selector.get_map():
+                continue
+
+            for key, _ in selector.select(timeout=0.1):
+                if is_open(key.fileobj):
+                    report(key.data)
+                reap(key.fileobj)
+
+            now = time.monotonic()
+            while deadlines and (deadlines[0][0] <= now or deadlines[0][1].fileno() == -1):
+                _, sock = deadlines.popleft()
+                if sock.fileno() != -1:
+                    reap(sock)
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+    return open_ports
 
 def scan_ports(ip):
+    address = socket.gethostbyname(ip)
+
     print(f"Scanning open ports on {ip}...\n")
     print(f"Scanning started at {datetime.now()}")
 
-    open_ports = []
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=100) as executor:
-        futures = {executor.submit(scan_port, ip, port): port for port in range(1, 65536)}
-        
-        for future in concurrent.futures.as_completed(futures):
-            port = future.result()
-            if port:
-                open_ports.append(port)
-                print(f"Port {port} is OPEN")
+    open_ports = run_scan(address)
 
     if not open_ports:
         print("No open ports found.")
@@ -38,10 +134,8 @@ def main():
     try:
         scan_ports(ip)
 
-    except ValueError:
+    except (ValueError, socket.gaierror):
         print("Invalid input. Please enter a valid IP address.")
 
 if __name__ == "__main__":
     main()
-
-                                
\ No newline at end of file
@@ -0,0 +1,34 @@
+import contextlib
+import io
+import socket
+import unittest
+
+from port_scanner import run_scan
+
+
+class RunScanTest(unittest.TestCase):
+    def test_reports_exactly_the_listening_ports(self):
+        listeners = []
+        for _ in range(3):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", 0))
+            sock.listen()
+            listeners.append(sock)
+            self.addCleanup(sock.close)
+        open_ports = [sock.getsockname()[1] for sock in listeners]
+
+        # Ports that were free a moment ago; nothing listens on them during the scan.
+        closed_ports = []
+        for _ in range(5):
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.bind(("127.0.0.1", 0))
+                closed_ports.append(sock.getsockname()[1])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            found = run_scan("127.0.0.1", max_in_flight=2, ports=closed_ports + open_ports)
+
+        self.assertEqual(sorted(found), sorted(open_ports))
+
+
+if __name__ == "__main__":
+    unittest.main()